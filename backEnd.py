@@ -1,28 +1,149 @@
 # backEnd.py
 """
 Módulo de backend para a aplicação HelpFit.
-Implementa lógica de persistência em SQLite e análise com pandas e numpy.
+Implementa lógica de persistência em SQLite e análise de frequência.
+Usa apenas a biblioteca padrão no carregamento; pandas é importado sob demanda.
 Inclui migração de schema automática para novas colunas.
 """
+import secrets
 import sqlite3
+import threading
+from contextlib import contextmanager
 from sqlite3 import Connection
-from datetime import datetime, date
-import pandas as pd
-import numpy as np
+from typing import TYPE_CHECKING, Iterable, Iterator, List, NamedTuple, Optional
+from datetime import date
+from functools import lru_cache
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 DB_FILE = 'helpfit.db'
 
+# Indica se o schema já foi verificado neste processo
+_INIT_DONE = False
+
+# Conexões reutilizadas, uma por thread
+_local = threading.local()
+
+# attendance.date guarda o ordinal gregoriano (date.toordinal());
+# somando este deslocamento obtém-se o dia juliano usado pelo SQLite.
+_JULIAN_OFFSET = 1721424.5
+
+_ATTENDANCE_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        student_id TEXT NOT NULL,
+        date INTEGER NOT NULL,
+        present INTEGER NOT NULL,
+        FOREIGN KEY(student_id) REFERENCES students(id) ON DELETE CASCADE
+    );
+'''
+
+# -------------------------------------------------------------
+# Consultas SQL (constantes reaproveitadas pelo cache de statements)
+# -------------------------------------------------------------
+_SQL_INSERT_STUDENT = '''
+    INSERT INTO students (
+        id, nome, cpf, data_matricula, data_nascimento,
+        telefone, sexo, comorbidade, dias_contratados, valor_plano
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+'''
+
+_SQL_DELETE_STUDENT = 'DELETE FROM students WHERE cpf = ?;'
+
+_SQL_INSERT_ATTENDANCE = 'INSERT INTO attendance (student_id, date, present) VALUES (?, ?, ?);'
+
+_SQL_INSERT_JUSTIFICATION = '''
+    INSERT INTO justifications (student_id, date, reason, canceled)
+    VALUES (?, ?, ?, ?);
+'''
+
+_SQL_ATTENDANCE_HISTORY = '''
+    SELECT date(a.date + ?), a.present, j.reason, j.canceled
+    FROM attendance a
+    LEFT JOIN justifications j
+      ON a.student_id = j.student_id AND date(a.date + ?) = j.date
+    WHERE a.student_id = ?
+    ORDER BY a.date;
+'''
+
+_SQL_MONTHLY_ATTENDANCE = '''
+    SELECT strftime('%Y-%m', date + ?) AS mes, SUM(present), COUNT(*)
+    FROM attendance
+    WHERE student_id = ?
+    GROUP BY mes
+    ORDER BY mes;
+'''
+
+# Colunas na ordem dos parâmetros de _build_student_info
+_SQL_STUDENT_SELECT = '''
+    SELECT s.id, s.nome, s.cpf, s.telefone, s.data_matricula, s.data_nascimento,
+           s.dias_contratados, s.valor_plano,
+           COALESCE(SUM(a.present), 0), COUNT(a.id)
+    FROM students s
+    LEFT JOIN attendance a ON a.student_id = s.id
+'''
+
+_SQL_STUDENT_FULL = _SQL_STUDENT_SELECT + '''
+    WHERE s.cpf = ?
+    GROUP BY s.id;
+'''
+
+_SQL_ALL_STUDENTS_FULL = _SQL_STUDENT_SELECT + '''
+    GROUP BY s.id
+    ORDER BY s.nome COLLATE NOCASE;
+'''
+
 # -------------------------------------------------------------
 # Conexão com banco
 # -------------------------------------------------------------
-def get_connection() -> Connection:
+def _open_connection() -> Connection:
     """
-    Abre conexão com SQLite, garantindo foreign_keys ativadas.
+    Abre nova conexão com SQLite, garantindo foreign_keys ativadas.
+    Usa WAL com synchronous=NORMAL para reduzir o custo de cada commit
+    e permitir leituras concorrentes às escritas.
     """
-    conn = sqlite3.connect(DB_FILE)
+    conn = sqlite3.connect(DB_FILE, check_same_thread=False)
     conn.execute("PRAGMA foreign_keys = ON;")
+    conn.execute("PRAGMA journal_mode = WAL;")
+    conn.execute("PRAGMA synchronous = NORMAL;")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute("PRAGMA mmap_size = 268435456;")
+    conn.execute("PRAGMA cache_size = -32000;")
+    return conn
+
+def _thread_connection() -> Connection:
+    """
+    Retorna a conexão da thread atual, abrindo-a na primeira chamada.
+    """
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = _open_connection()
+        _local.conn = conn
     return conn
 
+@contextmanager
+def get_connection() -> Iterator[Connection]:
+    """
+    Fornece a conexão da thread atual, criada sob demanda e reutilizada
+    entre chamadas. Em caso de exceção desfaz a transação pendente.
+    """
+    conn = _thread_connection()
+    try:
+        yield conn
+    except Exception:
+        conn.rollback()
+        raise
+
+def close_connection() -> None:
+    """
+    Fecha a conexão da thread atual, se existir.
+    """
+    conn = getattr(_local, 'conn', None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+
 # -------------------------------------------------------------
 # Inicialização e migração do banco
 # -------------------------------------------------------------
@@ -32,56 +153,72 @@ def init_db():
     - students: alunos
     - attendance: frequência
     - justifications: justificativas de faltas
+    Executa apenas uma vez por processo; chamadas seguintes retornam direto.
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    # Tabela students
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS students (
-            id TEXT PRIMARY KEY,
-            nome TEXT NOT NULL,
-            cpf TEXT UNIQUE NOT NULL,
-            data_matricula TEXT NOT NULL,
-            telefone TEXT,
-            sexo TEXT,
-            comorbidade TEXT,
-            dias_contratados INTEGER NOT NULL,
-            valor_plano REAL NOT NULL,
-            data_nascimento TEXT
-        );
-    ''')
-
-    # Tabela attendance
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS attendance (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            student_id TEXT NOT NULL,
-            date TEXT NOT NULL,
-            present INTEGER NOT NULL,
-            FOREIGN KEY(student_id) REFERENCES students(id) ON DELETE CASCADE
-        );
-    ''')
-
-    # Tabela justifications
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS justifications (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            student_id TEXT NOT NULL,
-            date TEXT NOT NULL,
-            reason TEXT,
-            canceled INTEGER,
-            FOREIGN KEY(student_id) REFERENCES students(id) ON DELETE CASCADE
-        );
-    ''')
-
-    # Índices
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_students_cpf ON students(cpf);')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_attendance_student ON attendance(student_id);')
-    cursor.execute('CREATE INDEX IF NOT EXISTS idx_just_student ON justifications(student_id);')
-
-    conn.commit()
-    conn.close()
+    global _INIT_DONE
+    if _INIT_DONE:
+        return
+
+    with get_connection() as conn:
+        cursor = conn.cursor()
+
+        # Tabela students
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS students (
+                id TEXT PRIMARY KEY,
+                nome TEXT NOT NULL,
+                cpf TEXT UNIQUE NOT NULL,
+                data_matricula TEXT NOT NULL,
+                telefone TEXT,
+                sexo TEXT,
+                comorbidade TEXT,
+                dias_contratados INTEGER NOT NULL,
+                valor_plano REAL NOT NULL,
+                data_nascimento TEXT
+            );
+        ''')
+
+        # Tabela attendance
+        cursor.execute(_ATTENDANCE_SCHEMA.format(table='attendance'))
+
+        # Migração: attendance.date TEXT 'YYYY-MM-DD' -> INTEGER ordinal
+        cols = {row[1]: row[2] for row in cursor.execute('PRAGMA table_info(attendance);')}
+        if cols['date'].upper() == 'TEXT':
+            cursor.execute('DROP TABLE IF EXISTS attendance_v2;')
+            cursor.execute(_ATTENDANCE_SCHEMA.format(table='attendance_v2'))
+            cursor.execute(
+                '''
+                INSERT INTO attendance_v2 (id, student_id, date, present)
+                SELECT id, student_id, CAST(julianday(date) - ? AS INTEGER), present
+                FROM attendance;
+                ''',
+                (_JULIAN_OFFSET,)
+            )
+            cursor.execute('DROP TABLE attendance;')
+            cursor.execute('ALTER TABLE attendance_v2 RENAME TO attendance;')
+
+        # Tabela justifications
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS justifications (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                student_id TEXT NOT NULL,
+                date TEXT NOT NULL,
+                reason TEXT,
+                canceled INTEGER,
+                FOREIGN KEY(student_id) REFERENCES students(id) ON DELETE CASCADE
+            );
+        ''')
+
+        # Índices
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_students_cpf ON students(cpf);')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_attendance_student_date ON attendance(student_id, date);')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_just_student_date ON justifications(student_id, date);')
+        # Índices de coluna única cobertos pelos compostos acima
+        cursor.execute('DROP INDEX IF EXISTS idx_attendance_student;')
+        cursor.execute('DROP INDEX IF EXISTS idx_just_student;')
+
+        conn.commit()
+    _INIT_DONE = True
 
 # -------------------------------------------------------------
 # CRUD de alunos
@@ -98,55 +235,127 @@ def add_student(
     comorbidade: str = None
 ) -> dict:
     init_db()
-    student_id = f"STU{int(datetime.now().timestamp())}"
-    conn = get_connection()
-    c = conn.cursor()
-    c.execute(
-        '''
-        INSERT INTO students (
-            id, nome, cpf, data_matricula, data_nascimento,
-            telefone, sexo, comorbidade, dias_contratados, valor_plano
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-        ''',
-        (
-            student_id, nome, cpf, data_matricula, data_nascimento,
-            telefone, sexo, comorbidade, dias_contratados, valor_plano
+    student_id = 'STU' + secrets.token_hex(6)
+    with get_connection() as conn:
+        c = conn.cursor()
+        c.execute(
+            _SQL_INSERT_STUDENT,
+            (
+                student_id, nome, cpf, data_matricula, data_nascimento,
+                telefone, sexo, comorbidade, dias_contratados, valor_plano
+            )
         )
+        conn.commit()
+    _cached_student_row.cache_clear()
+    # Aluno recém-criado ainda não tem frequência registrada
+    return _build_student_info(
+        student_id, nome, cpf, telefone, data_matricula, data_nascimento,
+        dias_contratados, valor_plano, dias_presentes=0, total_registros=0
     )
-    conn.commit()
-    conn.close()
-    return get_student_full(cpf)
+
+@lru_cache(maxsize=256)
+def _cached_student_row(cpf: str) -> Optional[tuple]:
+    """
+    Linha de _SQL_STUDENT_FULL em cache (tupla imutável).
+    O cache é limpo sempre que alunos ou frequências são alterados.
+    """
+    init_db()
+    with get_connection() as conn:
+        return conn.execute(_SQL_STUDENT_FULL, (cpf,)).fetchone()
 
 def get_student_by_cpf(cpf: str) -> dict:
-    return get_student_full(cpf)
+    """
+    Versão em cache de get_student_full, usada pelas buscas da interface.
+    Só a linha do banco fica em cache; o dicionário é montado a cada
+    chamada, então campos que dependem da data atual (idade, meses de
+    matrícula) continuam corretos e cada chamador recebe uma cópia própria.
+    """
+    row = _cached_student_row(cpf)
+    if row is None:
+        return None
+    return _build_student_info(*row)
+
+def list_students_full() -> List[dict]:
+    """
+    Retorna as informações completas de todos os alunos, em ordem alfabética
+    de nome, com uma única consulta agregada. Não passa pelo cache de
+    get_student_by_cpf, reservado às buscas individuais da interface.
+    """
+    init_db()
+    with get_connection() as conn:
+        rows = conn.execute(_SQL_ALL_STUDENTS_FULL).fetchall()
+    return [_build_student_info(*row) for row in rows]
 
 def delete_student(cpf: str) -> bool:
     init_db()
-    conn = get_connection()
-    c = conn.cursor()
-    c.execute('DELETE FROM students WHERE cpf = ?;', (cpf,))
-    affected = c.rowcount
-    conn.commit()
-    conn.close()
+    with get_connection() as conn:
+        c = conn.cursor()
+        c.execute(_SQL_DELETE_STUDENT, (cpf,))
+        affected = c.rowcount
+        conn.commit()
+    _cached_student_row.cache_clear()
     return affected > 0
 
 # -------------------------------------------------------------
 # Frequência e justificativas
 # -------------------------------------------------------------
+def _date_ordinal(day) -> int:
+    """
+    Converte date ou string 'YYYY-MM-DD' para o ordinal salvo em attendance.date.
+    """
+    if isinstance(day, str):
+        day = date.fromisoformat(day)
+    return day.toordinal()
+
 def record_attendance(student_id: str, date_str: str, present: bool) -> None:
     """
     Registra presença (present=True) ou falta (present=False) no dia especificado.
-    date_str deve estar no formato 'YYYY-MM-DD'.
+    date_str pode ser um date ou uma string no formato 'YYYY-MM-DD'.
     """
     init_db()
-    conn = get_connection()
-    c = conn.cursor()
-    c.execute(
-        'INSERT INTO attendance (student_id, date, present) VALUES (?, ?, ?);',
-        (student_id, date_str, int(present))
-    )
-    conn.commit()
-    conn.close()
+    with get_connection() as conn:
+        c = conn.cursor()
+        c.execute(
+            _SQL_INSERT_ATTENDANCE,
+            (student_id, _date_ordinal(date_str), int(present))
+        )
+        conn.commit()
+    _cached_student_row.cache_clear()
+
+class FrequencyWriter:
+    """
+    Contexto para registrar várias presenças/faltas reaproveitando a mesma
+    conexão e cursor. Usa uma conexão própria, separada da conexão da
+    thread, para que outras chamadas do backend dentro do bloco não
+    confirmem nem descartem os registros pendentes. Faz um único commit ao
+    sair do bloco, ou rollback se ocorrer exceção.
+
+    Leituras dentro do bloco funcionam normalmente (sem ver os registros
+    pendentes). Outras escritas esperam o lock do SQLite e falham com
+    "database is locked"; faça-as antes ou depois do bloco.
+
+        with FrequencyWriter() as w:
+            w.record(student_id, '2024-05-02', True)
+    """
+    def __enter__(self) -> 'FrequencyWriter':
+        init_db()
+        self._conn = _open_connection()
+        self._cursor = self._conn.cursor()
+        return self
+
+    def record(self, student_id: str, date_str: str, present: bool) -> None:
+        self._cursor.execute(_SQL_INSERT_ATTENDANCE, (student_id, _date_ordinal(date_str), int(present)))
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._cursor.close()
+        try:
+            if exc_type is None:
+                self._conn.commit()
+                _cached_student_row.cache_clear()
+            else:
+                self._conn.rollback()
+        finally:
+            self._conn.close()
 
 def justify_absence(student_id: str, date_str: str, reason: str, canceled: bool) -> None:
     """
@@ -154,88 +363,143 @@ def justify_absence(student_id: str, date_str: str, reason: str, canceled: bool)
     'canceled' indica se o aluno cancelou a presença.
     """
     init_db()
-    conn = get_connection()
-    c = conn.cursor()
-    c.execute(
-        '''
-        INSERT INTO justifications (student_id, date, reason, canceled)
-        VALUES (?, ?, ?, ?);
-        ''',
-        (student_id, date_str, reason, int(canceled))
-    )
-    conn.commit()
-    conn.close()
+    with get_connection() as conn:
+        c = conn.cursor()
+        c.execute(
+            _SQL_INSERT_JUSTIFICATION,
+            (student_id, date_str, reason, int(canceled))
+        )
+        conn.commit()
 
-def get_attendance_history(student_id: str) -> pd.DataFrame:
+def record_attendance_bulk(records: Iterable[tuple]) -> None:
     """
-    Retorna DataFrame com histórico de presença/falta e justificativas.
+    Registra várias presenças/faltas numa única transação.
+    records: iterável de (student_id, date_str, present).
     """
     init_db()
-    conn = get_connection()
-    df_att = pd.read_sql_query(
-        '''
-        SELECT a.date, a.present, j.reason, j.canceled
-        FROM attendance a
-        LEFT JOIN justifications j
-          ON a.student_id = j.student_id AND a.date = j.date
-        WHERE a.student_id = ?
-        ORDER BY a.date;
-        ''',
-        conn,
-        params=(student_id,),
-        parse_dates=['date']
-    )
-    conn.close()
+    with get_connection() as conn:
+        conn.execute('BEGIN IMMEDIATE;')
+        conn.executemany(
+            _SQL_INSERT_ATTENDANCE,
+            ((sid, _date_ordinal(d), int(p)) for sid, d, p in records)
+        )
+        conn.commit()
+    _cached_student_row.cache_clear()
+
+def justify_absence_bulk(records: Iterable[tuple]) -> None:
+    """
+    Insere várias justificativas de falta numa única transação.
+    records: iterável de (student_id, date_str, reason, canceled).
+    """
+    init_db()
+    with get_connection() as conn:
+        conn.execute('BEGIN IMMEDIATE;')
+        conn.executemany(
+            _SQL_INSERT_JUSTIFICATION,
+            ((sid, d, r, int(cn)) for sid, d, r, cn in records)
+        )
+        conn.commit()
+
+class AttendanceRecord(NamedTuple):
+    """
+    Linha do histórico de frequência com a justificativa do dia, se houver.
+    """
+    date: str
+    present: int
+    reason: Optional[str]
+    canceled: Optional[int]
+
+def get_attendance_history_raw(student_id: str) -> List[AttendanceRecord]:
+    """
+    Retorna o histórico de presença/falta e justificativas como lista de
+    AttendanceRecord, sem construir DataFrame. Datas ficam em 'YYYY-MM-DD'.
+    """
+    init_db()
+    with get_connection() as conn:
+        rows = conn.execute(
+            _SQL_ATTENDANCE_HISTORY,
+            (_JULIAN_OFFSET, _JULIAN_OFFSET, student_id)
+        ).fetchall()
+    return [AttendanceRecord._make(r) for r in rows]
+
+def get_attendance_history(student_id: str) -> 'pd.DataFrame':
+    """
+    Retorna DataFrame com histórico de presença/falta e justificativas.
+    pandas é importado apenas aqui, para não pesar nos demais caminhos.
+    """
+    import pandas as pd
+    df_att = pd.DataFrame(get_attendance_history_raw(student_id), columns=AttendanceRecord._fields)
+    df_att['date'] = pd.to_datetime(df_att['date'])
     return df_att
 
+def get_monthly_attendance(student_id: str) -> list:
+    """
+    Retorna lista de tuplas (mes 'YYYY-MM', presentes, faltas, total) por mês,
+    agregada diretamente no SQLite em ordem cronológica.
+    """
+    init_db()
+    with get_connection() as conn:
+        rows = conn.execute(
+            _SQL_MONTHLY_ATTENDANCE,
+            (_JULIAN_OFFSET, student_id)
+        ).fetchall()
+    return [(mes, presentes, total - presentes, total) for mes, presentes, total in rows]
+
 # -------------------------------------------------------------
 # Informações e cálculo de evasão
 # -------------------------------------------------------------
 def get_student_full(cpf: str) -> dict:
     init_db()
-    conn = get_connection()
-    student_df = pd.read_sql_query(
-        'SELECT * FROM students WHERE cpf = ?;', conn,
-        params=(cpf,), parse_dates=['data_matricula', 'data_nascimento']
-    )
-    if student_df.empty:
-        conn.close()
+    with get_connection() as conn:
+        row = conn.execute(
+            _SQL_STUDENT_FULL,
+            (cpf,)
+        ).fetchone()
+    if row is None:
         return None
-    student = student_df.iloc[0]
-    attendance_df = pd.read_sql_query(
-        'SELECT present FROM attendance WHERE student_id = ?;',
-        conn, params=(student.id,)
-    )
-    conn.close()
-    dias_presentes = int(attendance_df['present'].sum())
-    dias_faltas = len(attendance_df) - dias_presentes
-    total_contratado = student.dias_contratados
+    return _build_student_info(*row)
+
+def _build_student_info(
+    student_id: str,
+    nome: str,
+    cpf: str,
+    telefone: str,
+    data_matricula: str,
+    data_nascimento: str,
+    total_contratado: int,
+    valor_plano: float,
+    dias_presentes: int,
+    total_registros: int
+) -> dict:
+    """
+    Monta o dicionário de informações do aluno (idade, status, evasão)
+    a partir dos campos da tabela students e dos totais de frequência.
+    """
+    dias_faltas = total_registros - dias_presentes
     chance_evasao = round((dias_faltas / total_contratado) * 100, 2) if total_contratado > 0 else 0.0
     today = date.today()
     idade = None
-    if pd.notna(student.data_nascimento):
-        dn = student.data_nascimento
+    dn = date.fromisoformat(data_nascimento) if data_nascimento else None
+    if dn is not None:
         idade = today.year - dn.year - ((today.month, today.day) < (dn.month, dn.day))
-    dm = student.data_matricula
+    dm = date.fromisoformat(data_matricula)
     meses = (today.year - dm.year)*12 + today.month - dm.month
     status = 'Ativo' if dias_presentes >= total_contratado * 0.5 else 'Inativo'
     return {
-        'id': student.id,
-        'nome': student.nome,
-        'cpf': student.cpf,
-        'telefone': student.telefone,
-        'data_matricula': student.data_matricula.strftime('%Y-%m-%d'),
-        'data_nascimento': (
-            student.data_nascimento.strftime('%Y-%m-%d') if pd.notna(student.data_nascimento) else None
-        ),
+        'id': student_id,
+        'nome': nome,
+        'cpf': cpf,
+        'telefone': telefone,
+        'data_matricula': dm.isoformat(),
+        'data_nascimento': dn.isoformat() if dn is not None else None,
         'idade': idade,
         'dias_contratados': int(total_contratado),
-        'dias_presentes': dias_presentes,
-        'dias_faltas': dias_faltas,
+        'dias_presentes': int(dias_presentes),
+        'dias_faltas': int(dias_faltas),
         'status_matricula': status,
         'tempo_matricula_meses': meses,
         'chance_evasao_percent': chance_evasao,
-        'valor_plano': float(student.valor_plano)
+        'valor_plano': float(valor_plano)
     }
 
 # -------------------------------------------------------------
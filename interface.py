@@ -6,11 +6,21 @@ Este módulo define a interface de usuário usando Tkinter,
 com navegação entre páginas, paleta de cores personalizada e
 widgets organizados para cada funcionalidade.
 """
+import calendar
+import hashlib
+import hmac
+import re
+import sys
+import time
 import tkinter as tk
 from tkinter import ttk
-import tkinter.messagebox
-from datetime import datetime, date
-from backEnd import *
+from tkinter.messagebox import showerror, showinfo
+from collections import deque
+from datetime import date
+from functools import lru_cache, partial, wraps
+# backEnd é importado dentro dos handlers: a janela abre sem carregar a
+# camada de dados, que só é importada no primeiro uso (depois fica em
+# sys.modules).
 
 
 
@@ -33,6 +43,139 @@ FRAME_BG     = PALETTE[2]
 LF_BG        = PALETTE[3]
 LF_FG        = "white"
 BG_COLOR     = PALETTE[5]
+SUCCESS_FG   = "#6EE7B7"
+
+# Opções de Labels sobre fundos diferentes de BG_COLOR
+# (o padrão BG_COLOR/LF_FG vem do option database, ver HelpFitApp)
+INFO_LBL_STYLE = {"bg": FRAME_BG, "fg": LF_FG}
+LF_LBL_STYLE   = {"bg": LF_BG, "fg": LF_FG}
+
+# Páginas exibidas na barra de navegação, em ordem
+_NAV_PAGES = ("Inicio", "Cadastro", "Frequencia", "Relatorio", "Informacoes", "Perfil", "Login")
+
+# Opções fixas dos seletores de data
+_DAYS   = tuple(range(1, 32))
+_MONTHS = tuple(calendar.month_name[1:])
+
+# CPF com 11 dígitos ASCII, após remover pontos e hífen
+_CPF_RE = re.compile(r'^[0-9]{11}$')
+
+# SHA-256 da senha mestra exigida para excluir alunos
+_MASTER_HASH = bytes.fromhex("afeca8b7d62401544a14045e8b74aef53f0fb9c0dc3e3b502338d9830aa2ce01")
+
+# -------------------------------------------------------------
+# Utilitários
+# -------------------------------------------------------------
+def _normalize_cpf(s):
+    """
+    Remove espaços, pontos e hífen do CPF digitado; é a forma salva no banco.
+    """
+    return s.strip().replace('.', '').replace('-', '')
+
+@lru_cache(maxsize=256)
+def _br_to_iso(s):
+    """
+    Converte data 'DD/MM/AAAA' para 'AAAA-MM-DD'.
+    Levanta ValueError se o texto não for uma data válida.
+    Resultados são memorizados, pois as mesmas datas se repetem nos cadastros.
+    """
+    d, m, y = s.split('/')
+    digits = d + m + y
+    if len(d) != 2 or len(m) != 2 or len(y) != 4 or not (digits.isascii() and digits.isdigit()):
+        raise ValueError(f"data fora do formato DD/MM/AAAA: {s!r}")
+    # valida dia/mês, inclusive anos bissextos
+    return date(int(y), int(m), int(d)).isoformat()
+
+def throttle(ms):
+    """
+    Decorador que descarta chamadas feitas a menos de ms milissegundos
+    da última chamada aceita (ex.: duplo clique em um botão).
+    """
+    def deco(fn):
+        last = [0.0]
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            now = time.monotonic() * 1000
+            if now - last[0] < ms:
+                return None
+            last[0] = now
+            return fn(*args, **kwargs)
+        return wrapper
+    return deco
+
+def _ignore_while_busy(handler):
+    """
+    Decorador para handlers de botões: ignora cliques repetidos enquanto
+    o anterior é processado. A liberação é agendada com after_idle, de
+    modo que cliques já enfileirados também sejam descartados.
+    """
+    @wraps(handler)
+    def wrapper(self, *args, **kwargs):
+        if getattr(self, '_busy', False):
+            return None
+        self._busy = True
+        try:
+            return handler(self, *args, **kwargs)
+        finally:
+            self.after_idle(setattr, self, '_busy', False)
+    return wrapper
+
+def _flash_status(label, text, ms=2000):
+    """
+    Mostra uma mensagem não modal em label e a apaga após ms milissegundos.
+    """
+    label.configure(text=text)
+    pending = getattr(label, '_clear_id', None)
+    if pending is not None:
+        label.after_cancel(pending)
+    label._clear_id = label.after(ms, label.configure, {'text': ''})
+
+def _build_form(parent, fields):
+    """
+    Cria pares Label+Entry empilhados em parent (um StyledLabelFrame)
+    e retorna dicionário {rótulo: Entry}. Campos "Senha" são mascarados.
+    """
+    entries = {}
+    for idx, lbl in enumerate(fields):
+        tk.Label(parent, text=lbl, **LF_LBL_STYLE).grid(row=idx*2, column=0, sticky="w")
+        ent = tk.Entry(parent, show='*' if lbl == "Senha" else None)
+        ent.grid(row=idx*2+1, column=0, sticky="ew", pady=(0,10))
+        entries[lbl] = ent
+    return entries
+
+def open_date_picker(parent, entry_widget, years_back=100):
+    """
+    Abre uma janela de seleção de data simples e escreve a data
+    escolhida em entry_widget no formato DD/MM/AAAA.
+    """
+    top = tk.Toplevel(parent)
+    top.title("Selecione a data")
+    cal = tk.Frame(top, bg=BG_COLOR)
+    cal.pack(padx=10, pady=10)
+
+    # Seletores para dia, mês e ano
+    today = date.today()
+    current_year = today.year
+    years = tuple(range(current_year-years_back, current_year+1))
+
+    var_d = tk.StringVar(value=str(today.day))
+    var_m = tk.StringVar(value=_MONTHS[today.month-1])
+    var_y = tk.StringVar(value=str(current_year))
+
+    tk.Label(cal, text="Dia").grid(row=0, column=0)
+    ttk.Combobox(cal, textvariable=var_d, values=_DAYS, state='readonly', width=4).grid(row=1, column=0)
+    tk.Label(cal, text="Mês").grid(row=0, column=1)
+    ttk.Combobox(cal, textvariable=var_m, values=_MONTHS, state='readonly', width=10).grid(row=1, column=1)
+    tk.Label(cal, text="Ano").grid(row=0, column=2)
+    ttk.Combobox(cal, textvariable=var_y, values=years, state='readonly', width=6).grid(row=1, column=2)
+
+    def select():
+        m_index = _MONTHS.index(var_m.get())+1
+        entry_widget.delete(0, tk.END)
+        entry_widget.insert(0, f"{int(var_d.get()):02d}/{m_index:02d}/{int(var_y.get())}")
+        top.destroy()
+
+    tk.Button(top, text="OK", command=select).pack(pady=(5,10))
 
 # -------------------------------------------------------------
 # Classe principal da aplicação
@@ -49,6 +192,20 @@ class HelpFitApp(tk.Tk):
         self.geometry("900x650")
         self.configure(bg=BG_COLOR)
 
+        # Estilo único dos botões, configurado uma vez para toda a aplicação
+        style = ttk.Style(self)
+        style.theme_use('clam')
+        style.configure('HF.TButton', background=BUTTON_BG, foreground=BUTTON_FG)
+        style.map('HF.TButton', background=[('active', PALETTE[4])])
+        style.configure('Large.HF.TButton', font=(None, 14))
+        # Cores padrão de Labels e janelas auxiliares, resolvidas pelo Tk
+        # na criação de cada widget sem precisar de bg/fg explícitos
+        self.option_add('*Label.Background', BG_COLOR)
+        self.option_add('*Label.Foreground', LF_FG)
+        self.option_add('*Toplevel.Background', BG_COLOR)
+        # Fechar a conexão com o banco ao fechar a janela
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
         # Configura grid principal para que o container cresça
         self.rowconfigure(1, weight=1)
         self.columnconfigure(0, weight=1)
@@ -56,29 +213,31 @@ class HelpFitApp(tk.Tk):
         # Criar barra de navegação no topo
         nav = tk.Frame(self, bg=NAV_BG, bd=2, relief=tk.RAISED)
         nav.grid(row=0, column=0, sticky="ew")
-        pages = ["Inicio", "Cadastro", "Frequencia", "Relatorio", "Informacoes", "Perfil", "Login"]
         # Criar botão para cada página e configurar ação de troca de frame
-        for idx, page in enumerate(pages):
-            btn = tk.Button(
+        for idx, page in enumerate(_NAV_PAGES):
+            btn = ttk.Button(
                 nav,
                 text=page,
-                bg=BUTTON_BG,
-                fg=BUTTON_FG,
-                activebackground=PALETTE[4],
-                command=lambda p=page: self.show_frame(p)
+                style="HF.TButton",
+                command=partial(self.show_frame, page)
             )
             btn.grid(row=0, column=idx, padx=2, pady=2, sticky="ew")
-            nav.columnconfigure(idx, weight=1)
+        # Uma única chamada ao Tcl para todas as colunas
+        nav.columnconfigure(tuple(range(len(_NAV_PAGES))), weight=1)
 
         # Container principal onde os frames das páginas serão empilhados
-        container = tk.Frame(self, bg=BG_COLOR)
-        container.grid(row=1, column=0, sticky="nsew")
-        container.rowconfigure(0, weight=1)
-        container.columnconfigure(0, weight=1)
-
-        # Dicionário para armazenar instâncias de cada página
+        # Tamanho fixo: construir páginas não força recálculo de geometria
+        # da janela. Não chamar update()/update_idletasks() durante a montagem;
+        # o Tk agrupa o layout ao entrar no mainloop.
+        self.container = tk.Frame(self, bg=BG_COLOR, width=900, height=600)
+        self.container.grid_propagate(False)
+        self.container.grid(row=1, column=0, sticky="nsew")
+        self.container.rowconfigure(0, weight=1)
+        self.container.columnconfigure(0, weight=1)
+
+        # Classes das páginas; as instâncias são criadas no primeiro acesso
         self.frames = {}
-        page_classes = {
+        self.page_classes = {
             "Inicio":       InicioPage,
             "Cadastro":     CadastroPage,
             "Frequencia":    FrequenciaPage,
@@ -87,22 +246,56 @@ class HelpFitApp(tk.Tk):
             "Perfil":       PerfilPage,
             "Login":        LoginPage,
         }
-        # Instancia todas as páginas e as empilha no container
-        for name, PageClass in page_classes.items():
-            frame = PageClass(parent=container, controller=self)
-            self.frames[name] = frame
-            frame.grid(row=0, column=0, sticky="nsew")
 
         # Exibir página inicial por padrão
         self.show_frame("Inicio")
 
+        # Demais páginas são construídas em segundo plano, no tempo ocioso
+        self._pending_pages = deque(n for n in self.page_classes if n not in self.frames)
+        self.after(200, self._warm_next_page)
+
+    def _build_page(self, page_name):
+        """
+        Instancia a página e a empilha no container, guardando-a em self.frames.
+        """
+        frame = self.page_classes[page_name](parent=self.container, controller=self)
+        frame.grid(row=0, column=0, sticky="nsew")
+        self.frames[page_name] = frame
+        return frame
+
+    def _warm_next_page(self):
+        """
+        Constrói a próxima página pendente sem exibi-la e reagenda
+        a si mesma com after_idle até que todas estejam prontas.
+        """
+        while self._pending_pages:
+            name = self._pending_pages.popleft()
+            if name not in self.frames:
+                self._build_page(name).lower()
+                self.after_idle(self._warm_next_page)
+                return
+
     def show_frame(self, page_name):
         """
-        Traz o frame da página selecionada ao topo.
+        Traz o frame da página selecionada ao topo,
+        instanciando-o na primeira vez em que é exibido.
         """
         frame = self.frames.get(page_name)
-        if frame:
-            frame.tkraise()
+        if frame is None:
+            if page_name not in self.page_classes:
+                return
+            frame = self._build_page(page_name)
+        frame.tkraise()
+
+    def on_close(self):
+        """
+        Fecha a conexão do backend (se ele chegou a ser carregado) e
+        encerra a aplicação.
+        """
+        backend = sys.modules.get('backEnd')
+        if backend is not None:
+            backend.close_connection()
+        self.destroy()
 
 
 # -------------------------------------------------------------
@@ -126,6 +319,11 @@ class InicioPage(tk.Frame):
     """
     Página inicial com botões grandes para navegar entre as funcionalidades.
     """
+    __slots__ = ()
+
+    # Páginas acessíveis pelos botões, em grid 2 colunas x 3 linhas
+    _BUTTONS = ("Informacoes", "Cadastro", "Perfil", "Frequencia", "Login", "Relatorio")
+
     def __init__(self, parent, controller):
         super().__init__(parent, bg=BG_COLOR)
         # Container central para botões
@@ -133,21 +331,16 @@ class InicioPage(tk.Frame):
         main.place(relx=0.5, rely=0.5, anchor='center')
 
         # Configurar grid interno de 3x2
-        for i in range(3): main.rowconfigure(i, weight=1)
-        for j in range(2): main.columnconfigure(j, weight=1)
+        main.rowconfigure((0, 1, 2), weight=1)
+        main.columnconfigure((0, 1), weight=1)
 
-        # Lista de páginas para botões
-        buttons = ["Informacoes", "Cadastro", "Perfil", "Frequencia", "Login", "Relatorio"]
-        for idx, name in enumerate(buttons):
-            btn = tk.Button(
+        for idx, name in enumerate(self._BUTTONS):
+            btn = ttk.Button(
                 main,
                 text=name,
-                bg=BUTTON_BG,
-                fg=BUTTON_FG,
-                activebackground=PALETTE[4],
-                font=(None, 14),
+                style="Large.HF.TButton",
                 width=20,
-                command=lambda p=name: controller.show_frame(p)
+                command=partial(controller.show_frame, name)
             )
             # Posiciona em grid 2 colunas, 3 linhas
             btn.grid(row=idx//2, column=idx%2, padx=15, pady=15, sticky="nsew")
@@ -157,215 +350,164 @@ class CadastroPage(tk.Frame):
     Página de cadastro de um novo aluno.
     Usa um picker de data customizado em Tkinter sem depender de bibliotecas externas.
     """
+    # (rótulo, atributo da Entry, tem seletor de data) de cada coluna
+    LEFT_FIELDS = (
+        ("NOME*", "entry_nome", False),
+        ("CPF*", "entry_cpf", False),
+        ("DATA MATRÍCULA*", "entry_data_matricula", True),
+        ("DIAS POR MÊS CONTRATADOS*", "entry_dias_contratados", False),
+        ("VALOR PLANO*", "entry_valor_plano", False),
+    )
+    RIGHT_FIELDS = (
+        ("DATA NASCIMENTO*", "entry_data_nasc", True),
+        ("TELEFONE*", "entry_telefone", False),
+        ("SEXO", "entry_sexo", False),
+        ("COMORBIDADE?", "entry_comorbidade", False),
+    )
+
+    __slots__ = (
+        'controller', 'entry_nome', 'entry_cpf', 'entry_data_matricula',
+        'entry_data_nasc', 'entry_telefone', 'entry_sexo', 'entry_comorbidade',
+        'entry_dias_contratados', 'entry_valor_plano', 'status', '_all_entries',
+        '_busy',
+    )
+
     def __init__(self, parent, controller):
         super().__init__(parent, bg=BG_COLOR)
         self.controller = controller
 
         # Layout em duas colunas
-        self.columnconfigure(0, weight=1)
-        self.columnconfigure(1, weight=1)
-
-        # Esquerda: dados básicos
-        left = tk.Frame(self, bg=BG_COLOR)
-        left.grid(row=0, column=0, sticky="nsew", padx=30, pady=30)
-        left.columnconfigure(0, weight=1)
-
-        tk.Label(left, text="NOME*", bg=BG_COLOR, fg=LF_FG).grid(row=0, column=0, sticky="w")
-        self.entry_nome = tk.Entry(left)
-        self.entry_nome.grid(row=1, column=0, sticky="ew", pady=(0,10))
-
-        tk.Label(left, text="CPF*", bg=BG_COLOR, fg=LF_FG).grid(row=2, column=0, sticky="w")
-        self.entry_cpf = tk.Entry(left)
-        self.entry_cpf.grid(row=3, column=0, sticky="ew", pady=(0,10))
-
-        tk.Label(left, text="DATA MATRÍCULA*", bg=BG_COLOR, fg=LF_FG).grid(row=4, column=0, sticky="w")
-        frame_mat = tk.Frame(left, bg=BG_COLOR)
-        frame_mat.grid(row=5, column=0, sticky="ew", pady=(0,10))
-        frame_mat.columnconfigure(0, weight=1)
-        self.entry_data_matricula = tk.Entry(frame_mat)
-        self.entry_data_matricula.grid(row=0, column=0, sticky="ew")
-        tk.Button(frame_mat, text="📅", bg=BUTTON_BG, fg=BUTTON_FG,
-                  command=lambda: self.open_date_picker(self.entry_data_matricula)).grid(row=0, column=1, padx=(5,0))
-
-        tk.Label(left, text="DIAS POR MÊS CONTRATADOS*", bg=BG_COLOR, fg=LF_FG).grid(row=6, column=0, sticky="w")
-        self.entry_dias_contratados = tk.Entry(left)
-        self.entry_dias_contratados.grid(row=7, column=0, sticky="ew", pady=(0,10))
-
-        tk.Label(left, text="VALOR PLANO*", bg=BG_COLOR, fg=LF_FG).grid(row=8, column=0, sticky="w")
-        self.entry_valor_plano = tk.Entry(left)
-        self.entry_valor_plano.grid(row=9, column=0, sticky="ew", pady=(0,10))
-
-        # Direita: dados adicionais
-        right = tk.Frame(self, bg=BG_COLOR)
-        right.grid(row=0, column=1, sticky="nsew", padx=30, pady=30)
-        right.columnconfigure(0, weight=1)
-
-        tk.Label(right, text="DATA NASCIMENTO*", bg=BG_COLOR, fg=LF_FG).grid(row=0, column=0, sticky="w")
-        frame_nasc = tk.Frame(right, bg=BG_COLOR)
-        frame_nasc.grid(row=1, column=0, sticky="ew", pady=(0,10))
-        frame_nasc.columnconfigure(0, weight=1)
-        self.entry_data_nasc = tk.Entry(frame_nasc)
-        self.entry_data_nasc.grid(row=0, column=0, sticky="ew")
-        tk.Button(frame_nasc, text="📅", bg=BUTTON_BG, fg=BUTTON_FG,
-                  command=lambda: self.open_date_picker(self.entry_data_nasc)).grid(row=0, column=1, padx=(5,0))
-
-        tk.Label(right, text="TELEFONE*", bg=BG_COLOR, fg=LF_FG).grid(row=2, column=0, sticky="w")
-        self.entry_telefone = tk.Entry(right)
-        self.entry_telefone.grid(row=3, column=0, sticky="ew", pady=(0,10))
-
-        tk.Label(right, text="SEXO", bg=BG_COLOR, fg=LF_FG).grid(row=4, column=0, sticky="w")
-        self.entry_sexo = tk.Entry(right)
-        self.entry_sexo.grid(row=5, column=0, sticky="ew", pady=(0,10))
-
-        tk.Label(right, text="COMORBIDADE?", bg=BG_COLOR, fg=LF_FG).grid(row=6, column=0, sticky="w")
-        self.entry_comorbidade = tk.Entry(right)
-        self.entry_comorbidade.grid(row=7, column=0, sticky="ew", pady=(0,10))
+        self.columnconfigure((0, 1), weight=1)
+
+        # Esquerda: dados básicos; direita: dados adicionais
+        for col, fields in enumerate((self.LEFT_FIELDS, self.RIGHT_FIELDS)):
+            side = tk.Frame(self, bg=BG_COLOR)
+            side.grid(row=0, column=col, sticky="nsew", padx=30, pady=30)
+            side.columnconfigure(0, weight=1)
+            for i, (label, attr, has_picker) in enumerate(fields):
+                tk.Label(side, text=label).grid(row=2*i, column=0, sticky="w")
+                if has_picker:
+                    holder = tk.Frame(side, bg=BG_COLOR)
+                    holder.grid(row=2*i+1, column=0, sticky="ew", pady=(0,10))
+                    holder.columnconfigure(0, weight=1)
+                    entry = tk.Entry(holder)
+                    entry.grid(row=0, column=0, sticky="ew")
+                    ttk.Button(holder, text="📅", style="HF.TButton", width=3,
+                               command=partial(open_date_picker, self, entry)).grid(row=0, column=1, padx=(5,0))
+                else:
+                    entry = tk.Entry(side)
+                    entry.grid(row=2*i+1, column=0, sticky="ew", pady=(0,10))
+                setattr(self, attr, entry)
+        self._all_entries = tuple(
+            getattr(self, attr) for _, attr, _ in self.LEFT_FIELDS + self.RIGHT_FIELDS
+        )
 
-        tk.Button(
-            self, text="Cadastrar", bg=BUTTON_BG, fg=BUTTON_FG,
-            activebackground=PALETTE[4], width=15,
+        ttk.Button(
+            self, text="Cadastrar", style="HF.TButton", width=15,
             command=self.on_register
         ).grid(row=1, column=0, columnspan=2, pady=10)
 
-    def open_date_picker(self, entry_widget):
-        """
-        Abre uma janela de seleção de data simples.
-        """
-        top = tk.Toplevel(self)
-        top.title("Selecione a data")
-        cal = tk.Frame(top)
-        cal.pack(padx=10, pady=10)
-
-        # Comboboxes para dia, mês e ano
-        import calendar
-        days = list(range(1,32))
-        months = list(calendar.month_name)[1:]
-        current_year = date.today().year
-        years = list(range(current_year-100, current_year+1))
-
-        var_d = tk.IntVar(value=date.today().day)
-        var_m = tk.StringVar(value=months[date.today().month-1])
-        var_y = tk.IntVar(value=current_year)
-
-        tk.Label(cal, text="Dia").grid(row=0, column=0)
-        tk.OptionMenu(cal, var_d, *days).grid(row=1, column=0)
-        tk.Label(cal, text="Mês").grid(row=0, column=1)
-        tk.OptionMenu(cal, var_m, *months).grid(row=1, column=1)
-        tk.Label(cal, text="Ano").grid(row=0, column=2)
-        tk.OptionMenu(cal, var_y, *years).grid(row=1, column=2)
-
-        def select():
-            m_index = months.index(var_m.get())+1
-            entry_widget.delete(0, tk.END)
-            entry_widget.insert(0, f"{var_d.get():02d}/{m_index:02d}/{var_y.get()}")
-            top.destroy()
-
-        tk.Button(top, text="OK", command=select).pack(pady=(5,10))
+        # Confirmação de cadastro, sem janela modal
+        self.status = tk.Label(self, text="", fg=SUCCESS_FG)
+        self.status.grid(row=2, column=0, columnspan=2)
 
+    @throttle(300)
+    @_ignore_while_busy
     def on_register(self):
         """
         Captura valores, converte datas ISO, chama add_student e limpa campos.
         """
         nome = self.entry_nome.get().strip()
-        cpf = self.entry_cpf.get().strip()
+        cpf = _normalize_cpf(self.entry_cpf.get())
         dmat = self.entry_data_matricula.get().strip()
         dnasc = self.entry_data_nasc.get().strip()
         tel = self.entry_telefone.get().strip()
 
+        # Validações rápidas antes de qualquer acesso ao banco
+        if not nome:
+            showerror("Nome obrigatório", "Informe o nome do aluno.")
+            return
+        if not _CPF_RE.match(cpf):
+            showerror("CPF inválido", "O CPF deve conter 11 dígitos.")
+            return
+        try:
+            dias = int(self.entry_dias_contratados.get().strip())
+            valor = float(self.entry_valor_plano.get().strip())
+        except ValueError:
+            showerror("Valor inválido", "Dias contratados e valor do plano devem ser numéricos.")
+            return
+
         # Converter datas
         try:
-            dm = datetime.strptime(dmat, "%d/%m/%Y").strftime("%Y-%m-%d")
-            dn = datetime.strptime(dnasc, "%d/%m/%Y").strftime("%Y-%m-%d")
+            dm = _br_to_iso(dmat)
+            dn = _br_to_iso(dnasc)
         except ValueError:
-            tk.messagebox.showerror("Data Inválida", "Use DD/MM/YYYY para as datas.")
+            showerror("Data Inválida", "Use DD/MM/YYYY para as datas.")
             return
 
+        from backEnd import add_student
         try:
-            dias = int(self.entry_dias_contratados.get().strip())
-            valor = float(self.entry_valor_plano.get().strip())
             aluno = add_student(
                 nome, cpf, dm, dias, valor,
                 data_nascimento=dn, telefone=tel,
                 sexo=self.entry_sexo.get().strip(),
                 comorbidade=self.entry_comorbidade.get().strip()
             )
-            tk.messagebox.showinfo("Sucesso", f"Aluno {aluno['nome']} cadastrado!")
-            for e in [self.entry_nome, self.entry_cpf, self.entry_data_matricula,
-                      self.entry_data_nasc, self.entry_telefone,
-                      self.entry_dias_contratados, self.entry_valor_plano,
-                      self.entry_sexo, self.entry_comorbidade]:
+            _flash_status(self.status, f"Aluno {aluno['nome']} cadastrado!")
+            for e in self._all_entries:
                 e.delete(0, tk.END)
         except Exception as ex:
-            tk.messageebox.showerror("Erro ao cadastrar", str(ex))
+            showerror("Erro ao cadastrar", str(ex))
 
 class FrequenciaPage(tk.Frame):
+    __slots__ = ('controller', 'entry_cpf', 'entry_data', 'status', '_busy')
+
     def __init__(self, parent, controller):
         super().__init__(parent, bg='white')
         self.controller = controller
 
-        tk.Label(self, text="CPF do aluno:", bg='white').grid(row=0, column=0, sticky="w", padx=10, pady=5)
+        tk.Label(self, text="CPF do aluno:", bg='white', fg='black').grid(row=0, column=0, sticky="w", padx=10, pady=5)
         self.entry_cpf = tk.Entry(self)
         self.entry_cpf.grid(row=0, column=1, padx=10, pady=5)
 
-        tk.Label(self, text="Data (DD/MM/AAAA):", bg='white').grid(row=1, column=0, sticky="w", padx=10, pady=5)
+        tk.Label(self, text="Data (DD/MM/AAAA):", bg='white', fg='black').grid(row=1, column=0, sticky="w", padx=10, pady=5)
         frame_data = tk.Frame(self, bg='white')
         frame_data.grid(row=1, column=1, sticky="ew", padx=10, pady=5)
         self.entry_data = tk.Entry(frame_data)
         self.entry_data.grid(row=0, column=0)
         tk.Button(
-            frame_data, text="📅", command=lambda: self.open_date_picker(self.entry_data)
+            frame_data, text="📅", command=partial(open_date_picker, self, self.entry_data, years_back=50)
         ).grid(row=0, column=1, padx=(5, 0))
 
         tk.Button(self, text="Registrar Presença", command=self.on_record).grid(row=2, column=0, columnspan=2, pady=10)
 
-    def open_date_picker(self, entry_widget):
-        top = tk.Toplevel(self)
-        top.title("Selecione a data")
-        import calendar
-        days = list(range(1,32))
-        months = list(calendar.month_name)[1:]
-        current_year = date.today().year
-        years = list(range(current_year-50, current_year+1))
-
-        var_d = tk.IntVar(value=date.today().day)
-        var_m = tk.StringVar(value=months[date.today().month-1])
-        var_y = tk.IntVar(value=current_year)
-
-        frm = tk.Frame(top)
-        frm.pack(padx=10, pady=10)
-        tk.OptionMenu(frm, var_d, *days).grid(row=0, column=0)
-        tk.OptionMenu(frm, var_m, *months).grid(row=0, column=1)
-        tk.OptionMenu(frm, var_y, *years).grid(row=0, column=2)
-
-        def select():
-            m_index = months.index(var_m.get()) + 1
-            entry_widget.delete(0, tk.END)
-            entry_widget.insert(0, f"{var_d.get():02d}/{m_index:02d}/{var_y.get()}")
-            top.destroy()
-
-        tk.Button(top, text="OK", command=select).pack(pady=5)
+        # Confirmação de registro, sem janela modal
+        self.status = tk.Label(self, text="", bg='white', fg='green')
+        self.status.grid(row=3, column=0, columnspan=2)
 
+    @_ignore_while_busy
     def on_record(self):
-        cpf = self.entry_cpf.get().strip()
+        cpf = _normalize_cpf(self.entry_cpf.get())
         date_str = self.entry_data.get().strip()
         try:
-            date_iso = datetime.strptime(date_str, "%d/%m/%Y").strftime("%Y-%m-%d")
+            date_iso = _br_to_iso(date_str)
         except ValueError:
-            tk.messagebox.showerror("Data inválida", "Use o formato DD/MM/AAAA")
+            showerror("Data inválida", "Use o formato DD/MM/AAAA")
             return
 
+        from backEnd import get_student_by_cpf, record_attendance
         aluno = get_student_by_cpf(cpf)
         if not aluno:
-            tk.messagebox.showerror("Erro", "Aluno não encontrado.")
+            showerror("Erro", "Aluno não encontrado.")
             return
 
         try:
             record_attendance(aluno['id'], date_iso, present=True)
-            tk.messagebox.showinfo("Sucesso", "Presença registrada com sucesso!")
+            _flash_status(self.status, "Presença registrada com sucesso!")
             self.entry_cpf.delete(0, tk.END)
             self.entry_data.delete(0, tk.END)
         except Exception as e:
-            tk.messagebox.showerror("Erro", f"Falha ao registrar presença: {e}")
+            showerror("Erro", f"Falha ao registrar presença: {e}")
 
 
 
@@ -373,6 +515,11 @@ class RelatorioPage(tk.Frame):
     """
     Página para visualização de relatórios de evasão gerados por IA.
     """
+    __slots__ = ('txt', '_gen')
+
+    # Linhas do relatório inseridas por vez no Text
+    _LINES_PER_BLOCK = 50
+
     def __init__(self, parent, controller):
         super().__init__(parent, bg=BG_COLOR)
         # Configurar área de texto expansível
@@ -381,19 +528,67 @@ class RelatorioPage(tk.Frame):
         tk.Label(
             self,
             text="Relatório de Previsão de Evasão feito com IA",
-            font=(None, 16),
-            bg=BG_COLOR,
-            fg=LF_FG
+            font=(None, 16)
         ).grid(row=0, column=0, pady=10)
-        txt = tk.Text(self)
-        txt.grid(row=1, column=0, sticky="nsew", padx=20, pady=10)
-        tk.Button(
+        # Área do relatório: sem quebra de linha, undo ou exportação de seleção,
+        # que recalculam a cada inserção. Preencher com um único insert()
+        # do texto completo (ou de blocos grandes), nunca caractere a caractere.
+        self.txt = tk.Text(self, wrap='none', exportselection=0, undo=False)
+        self.txt.grid(row=1, column=0, sticky="nsew", padx=20, pady=10)
+        ttk.Button(
             self,
             text="Gerar Relatório",
-            bg=BUTTON_BG,
-            fg=BUTTON_FG,
-            activebackground=PALETTE[4]
+            style="HF.TButton",
+            command=self._start_report
         ).grid(row=2, column=0, pady=10)
+        self._gen = None
+
+    def _generate_report(self):
+        """
+        Gera o relatório em blocos de até _LINES_PER_BLOCK linhas.
+        Todos os alunos vêm de uma única consulta ao banco.
+        """
+        from backEnd import list_students_full
+        alunos = list_students_full()
+        if not alunos:
+            yield "Nenhum aluno cadastrado.\n"
+            return
+        lines = [f"{'Aluno':<30} {'CPF':<14} {'Status':<8} Chance de Evasão\n"]
+        for aluno in alunos:
+            lines.append(f"{aluno['nome']:<30} {aluno['cpf']:<14} {aluno['status_matricula']:<8} "
+                         f"{aluno['chance_evasao_percent']:.2f}%\n")
+            if len(lines) >= self._LINES_PER_BLOCK:
+                yield "".join(lines)
+                lines = []
+        if lines:
+            yield "".join(lines)
+
+    def _start_report(self):
+        """
+        Inicia a geração do relatório sem bloquear o mainloop:
+        cada bloco é inserido por _pump, agendado com after().
+        """
+        if self._gen is not None:
+            return
+        self.txt.delete("1.0", tk.END)
+        self._gen = self._generate_report()
+        self.after(0, self._pump)
+
+    def _pump(self):
+        """
+        Insere o próximo bloco do relatório e reagenda até o fim.
+        """
+        try:
+            chunk = next(self._gen)
+        except StopIteration:
+            self._gen = None
+            return
+        except Exception as e:
+            self._gen = None
+            showerror("Erro", f"Falha ao gerar relatório: {e}")
+            return
+        self.txt.insert(tk.END, chunk)
+        self.after(10, self._pump)
 
 
 # --- Em interface.py ---
@@ -403,6 +598,25 @@ class InformacoesPage(tk.Frame):
     Página de busca de aluno. Exibe dados, chance de evasão e exclusão via senha.
     O campo de senha aparece somente quando o botão 'Excluir Aluno' é clicado.
     """
+    __slots__ = (
+        'controller', 'search_entry', '_value_labels', 'info_frame', 'btn_delete',
+        'pass_label', 'pass_entry', 'confirm_btn',
+        '_pass_row', '_info_visible', '_pass_visible', '_busy',
+    )
+
+    # Painel de informações: (rótulo, chave em aluno, formatador ou None),
+    # na ordem de exibição
+    _FIELDS = (
+        ("ID:", "id", None),
+        ("Nome:", "nome", None),
+        ("CPF:", "cpf", None),
+        ("Data Matrícula:", "data_matricula", None),
+        ("Dias Contratados:", "dias_contratados", str),
+        ("Valor Plano:", "valor_plano", lambda v: f"{v:.2f}"),
+        ("Telefone:", "telefone", lambda v: v or ""),
+        ("Chance de Evasão:", "chance_evasao_percent", lambda v: f"{v:.2f}%"),
+    )
+
     def __init__(self, parent, controller):
         super().__init__(parent, bg=BG_COLOR)
         self.controller = controller
@@ -411,15 +625,13 @@ class InformacoesPage(tk.Frame):
         search_frame = tk.Frame(self, bg=BG_COLOR)
         search_frame.grid(row=0, column=0, sticky="ew", padx=20, pady=10)
         search_frame.columnconfigure(1, weight=1)
-        tk.Label(search_frame, text="Buscar (CPF):", bg=BG_COLOR, fg=LF_FG).grid(row=0, column=0, sticky="w")
+        tk.Label(search_frame, text="Buscar (CPF):").grid(row=0, column=0, sticky="w")
         self.search_entry = tk.Entry(search_frame)
         self.search_entry.grid(row=0, column=1, sticky="ew", padx=5)
-        tk.Button(
+        ttk.Button(
             search_frame,
             text="Pesquisar",
-            bg=BUTTON_BG,
-            fg=BUTTON_FG,
-            activebackground=PALETTE[4],
+            style="HF.TButton",
             command=self.on_search
         ).grid(row=0, column=2, padx=5)
 
@@ -430,35 +642,33 @@ class InformacoesPage(tk.Frame):
         info_frame.columnconfigure(1, weight=1)
 
         # Campos de exibição
-        self.info_labels = {}
-        fields = ["ID:", "Nome:", "CPF:", "Data Matrícula:",
-                  "Dias Contratados:", "Valor Plano:", "Telefone:", "Chance de Evasão:"]
-        for idx, label_text in enumerate(fields):
-            tk.Label(info_frame, text=label_text, bg=FRAME_BG, fg=LF_FG).grid(row=idx, column=0, sticky="w", pady=2)
-            val_lbl = tk.Label(info_frame, text="", bg=FRAME_BG, fg=LF_FG)
+        # Rótulos de valor na mesma ordem de _FIELDS
+        self._value_labels = []
+        fields = self._FIELDS
+        for idx, (label_text, _, _) in enumerate(fields):
+            tk.Label(info_frame, text=label_text, **INFO_LBL_STYLE).grid(row=idx, column=0, sticky="w", pady=2)
+            val_lbl = tk.Label(info_frame, text="", **INFO_LBL_STYLE)
             val_lbl.grid(row=idx, column=1, sticky="w", pady=2)
-            self.info_labels[label_text] = val_lbl
+            self._value_labels.append(val_lbl)
 
         # Botão Excluir (inicia fluxo de senha)
-        self.btn_delete = tk.Button(
+        self.btn_delete = ttk.Button(
             info_frame,
             text="Excluir Aluno",
-            bg=BUTTON_BG,
-            fg=BUTTON_FG,
-            activebackground=PALETTE[4],
+            style="HF.TButton",
             command=self.show_password_field
         )
         self.btn_delete.grid(row=len(fields), column=0, columnspan=2, pady=(10,0))
+        # Linha do campo de senha, logo abaixo do botão Excluir
+        self._pass_row = len(fields) + 1
 
         # Campo senha e botão confirmar (ocultos)
-        self.pass_label = tk.Label(info_frame, text="Senha:", bg=FRAME_BG, fg=LF_FG)
+        self.pass_label = tk.Label(info_frame, text="Senha:", **INFO_LBL_STYLE)
         self.pass_entry = tk.Entry(info_frame, show="*")
-        self.confirm_btn = tk.Button(
+        self.confirm_btn = ttk.Button(
             info_frame,
             text="Confirmar Exclusão",
-            bg=BUTTON_BG,
-            fg=BUTTON_FG,
-            activebackground=PALETTE[4],
+            style="HF.TButton",
             command=self.on_delete_confirm
         )
 
@@ -467,47 +677,52 @@ class InformacoesPage(tk.Frame):
         self.pass_entry.grid_remove()
         self.confirm_btn.grid_remove()
         self.info_frame = info_frame
+        # Estado de visibilidade, evita passes de layout redundantes
+        self._info_visible = True
+        self._pass_visible = False
 
+    @throttle(300)
+    @_ignore_while_busy
     def on_search(self):
-        cpf = self.search_entry.get().strip()
+        from backEnd import get_student_by_cpf
+        cpf = _normalize_cpf(self.search_entry.get())
         aluno = get_student_by_cpf(cpf)
         if not aluno:
-            tk.messagebox.showerror("Não encontrado", "CPF não cadastrado.")
+            showerror("Não encontrado", "CPF não cadastrado.")
             return
         # Preencher campos
-        mapping = {
-            "ID:": aluno['id'],
-            "Nome:": aluno['nome'],
-            "CPF:": aluno['cpf'],
-            "Data Matrícula:": aluno['data_matricula'],
-            "Dias Contratados:": str(aluno['dias_contratados']),
-            "Valor Plano:": f"{aluno['valor_plano']:.2f}",
-            "Telefone:": aluno.get('telefone', ''),
-            "Chance de Evasão:": f"{aluno['chance_evasao_percent']:.2f}%"
-        }
-        for key, val in mapping.items():
-            self.info_labels[key].configure(text=val)
-        self.info_frame.grid()
+        for (_, attr, fmt), lbl in zip(self._FIELDS, self._value_labels):
+            v = aluno[attr]
+            lbl.configure(text=fmt(v) if fmt else v)
+        if not self._info_visible:
+            self.info_frame.grid()
+            self._info_visible = True
 
     def show_password_field(self):
         # Exibe o campo de senha e botão de confirmação
-        total = len(self.info_labels)
-        self.pass_label.grid(row=total, column=0, pady=(5,2))
-        self.pass_entry.grid(row=total, column=1, pady=(5,2))
-        self.confirm_btn.grid(row=total+1, column=0, columnspan=2, pady=(2,10))
+        if self._pass_visible:
+            return
+        self._pass_visible = True
+        row = self._pass_row
+        self.pass_label.grid(row=row, column=0, pady=(5,2))
+        self.pass_entry.grid(row=row, column=1, pady=(5,2))
+        self.confirm_btn.grid(row=row+1, column=0, columnspan=2, pady=(2,10))
 
+    @_ignore_while_busy
     def on_delete_confirm(self):
         senha = self.pass_entry.get()
-        if senha != "Helpfitmestra":
-            tk.messagebox.showerror("Senha incorreta", "Senha mestra inválida.")
+        if not hmac.compare_digest(hashlib.sha256(senha.encode()).digest(), _MASTER_HASH):
+            showerror("Senha incorreta", "Senha mestra inválida.")
             return
-        cpf = self.search_entry.get().strip()
+        from backEnd import delete_student
+        cpf = _normalize_cpf(self.search_entry.get())
         sucesso = delete_student(cpf)
         if sucesso:
-            tk.messagebox.showinfo("Excluído", "Aluno removido com sucesso.")
+            showinfo("Excluído", "Aluno removido com sucesso.")
             self.info_frame.grid_remove()
+            self._info_visible = False
         else:
-            tk.messagebox.showerror("Erro", "Falha ao excluir aluno.")
+            showerror("Erro", "Falha ao excluir aluno.")
 
 
 
@@ -516,6 +731,8 @@ class PerfilPage(tk.Frame):
     Página com informações do funcionário autenticado.
     Campos apenas leitura.
     """
+    __slots__ = ()
+
     def __init__(self, parent, controller):
         super().__init__(parent, bg=BG_COLOR)
         # Formulário centralizado
@@ -525,17 +742,13 @@ class PerfilPage(tk.Frame):
         tk.Label(
             form,
             text="Informações Funcionário",
-            font=(None, 16),
-            bg=BG_COLOR,
-            fg=LF_FG
+            font=(None, 16)
         ).grid(row=0, column=0, columnspan=2, pady=(0,15))
-        labels = ["Nome:", "Matrícula:", "Senha:"]
+        labels = ("Nome:", "Matrícula:", "Senha:")
         for idx, text in enumerate(labels):
             tk.Label(
                 form,
-                text=text,
-                bg=BG_COLOR,
-                fg=LF_FG
+                text=text
             ).grid(row=idx+1, column=0, sticky="e", padx=5, pady=5)
             ent = tk.Entry(form, state='disabled', width=30)
             if text == "Senha":
@@ -547,6 +760,8 @@ class LoginPage(tk.Frame):
     """
     Página para login e cadastro de funcionários.
     """
+    __slots__ = ('login_entries', 'signup_entries')
+
     def __init__(self, parent, controller):
         super().__init__(parent, bg=BG_COLOR)
         self.columnconfigure((0,1), weight=1)
@@ -555,32 +770,22 @@ class LoginPage(tk.Frame):
         left = StyledLabelFrame(self, text="Logar Funcionário", padx=10, pady=10)
         left.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
         left.columnconfigure(0, weight=1)
-        for idx, lbl in enumerate(["Matrícula", "Senha"]):
-            tk.Label(left, text=lbl, bg=LF_BG, fg=LF_FG).grid(row=idx*2, column=0, sticky="w")
-            ent = tk.Entry(left, show='*' if lbl=="Senha" else None)
-            ent.grid(row=idx*2+1, column=0, sticky="ew", pady=(0,10))
-        tk.Button(
+        self.login_entries = _build_form(left, ("Matrícula", "Senha"))
+        ttk.Button(
             left,
             text="Logar",
-            bg=BUTTON_BG,
-            fg=BUTTON_FG,
-            activebackground=PALETTE[4]
+            style="HF.TButton"
         ).grid(row=4, column=0, pady=5)
 
         # Seção de cadastro de funcionário
         right = StyledLabelFrame(self, text="Cadastrar Funcionário", padx=10, pady=10)
         right.grid(row=0, column=1, sticky="nsew", padx=20, pady=20)
         right.columnconfigure(0, weight=1)
-        for idx, lbl in enumerate(["Nome", "Matrícula", "Senha"]):
-            tk.Label(right, text=lbl, bg=LF_BG, fg=LF_FG).grid(row=idx*2, column=0, sticky="w")
-            ent = tk.Entry(right, show='*' if lbl=="Senha" else None)
-            ent.grid(row=idx*2+1, column=0, sticky="ew", pady=(0,10))
-        tk.Button(
+        self.signup_entries = _build_form(right, ("Nome", "Matrícula", "Senha"))
+        ttk.Button(
             right,
             text="Cadastrar",
-            bg=BUTTON_BG,
-            fg=BUTTON_FG,
-            activebackground=PALETTE[4]
+            style="HF.TButton"
         ).grid(row=6, column=0, pady=5)
 
 
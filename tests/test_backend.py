@@ -0,0 +1,104 @@
+# tests/test_backend.py
+"""
+Testes do backend da aplicação HelpFit, usando um banco SQLite temporário.
+Executar com: python -m unittest discover -s tests
+"""
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import backEnd
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+
+class TempDbTestCase(unittest.TestCase):
+    """
+    Aponta o backend para um banco vazio em diretório temporário.
+    """
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._old_db = backEnd.DB_FILE
+        backEnd.close_connection()
+        backEnd.DB_FILE = os.path.join(self._tmp.name, 'test.db')
+        backEnd._INIT_DONE = False
+        backEnd._cached_student_row.cache_clear()
+
+    def tearDown(self):
+        backEnd.close_connection()
+        backEnd.DB_FILE = self._old_db
+        backEnd._INIT_DONE = False
+        backEnd._cached_student_row.cache_clear()
+        self._tmp.cleanup()
+
+
+class AttendanceHistoryTest(TempDbTestCase):
+    """
+    Histórico longo com justificativa só no final: as colunas reason/canceled
+    ficam NULL por mais de 1024 linhas antes do primeiro valor.
+    """
+    N_DAYS = 1500
+    JUSTIFIED_ROW = 1400
+
+    def setUp(self):
+        super().setUp()
+        aluno = backEnd.add_student('Ana', '11122233344', '2020-01-01', 12, 99.9)
+        self.student_id = aluno['id']
+        start = date(2020, 1, 1)
+        days = [start + timedelta(days=i) for i in range(self.N_DAYS)]
+        backEnd.record_attendance_bulk(
+            (self.student_id, d.isoformat(), i % 2) for i, d in enumerate(days)
+        )
+        self.justified_day = days[self.JUSTIFIED_ROW].isoformat()
+        backEnd.justify_absence(self.student_id, self.justified_day, 'Atestado', True)
+
+    def test_raw_history_keeps_late_justification(self):
+        rows = backEnd.get_attendance_history_raw(self.student_id)
+        self.assertEqual(len(rows), self.N_DAYS)
+        justified = [r for r in rows if r.reason is not None]
+        self.assertEqual(len(justified), 1)
+        self.assertEqual(justified[0].date, self.justified_day)
+        self.assertEqual(justified[0].reason, 'Atestado')
+
+    @unittest.skipIf(pandas is None, "pandas não instalado")
+    def test_dataframe_history_keeps_late_justification(self):
+        df = backEnd.get_attendance_history(self.student_id)
+        self.assertEqual(len(df), self.N_DAYS)
+        self.assertEqual(df['reason'].notna().sum(), 1)
+        row = df[df['reason'].notna()].iloc[0]
+        self.assertEqual(row['date'].date().isoformat(), self.justified_day)
+        self.assertEqual(row['reason'], 'Atestado')
+
+
+class ListStudentsFullTest(TempDbTestCase):
+    def test_all_students_in_one_query_ordered_by_name(self):
+        bia = backEnd.add_student('bia', '22222222222', '2024-01-01', 10, 80.0)
+        backEnd.add_student('Ana', '11111111111', '2024-01-01', 10, 80.0)
+        backEnd.add_student('Caio', '33333333333', '2024-01-01', 10, 80.0)
+        backEnd.record_attendance_bulk([
+            (bia['id'], '2024-01-02', True),
+            (bia['id'], '2024-01-03', False),
+        ])
+
+        alunos = backEnd.list_students_full()
+
+        self.assertEqual([a['nome'] for a in alunos], ['Ana', 'bia', 'Caio'])
+        self.assertEqual(alunos[1], backEnd.get_student_full('22222222222'))
+        self.assertEqual((alunos[1]['dias_presentes'], alunos[1]['dias_faltas']), (1, 1))
+        self.assertEqual((alunos[0]['dias_presentes'], alunos[0]['dias_faltas']), (0, 0))
+
+    def test_does_not_fill_student_cache(self):
+        backEnd.add_student('Ana', '11111111111', '2024-01-01', 10, 80.0)
+        backEnd.list_students_full()
+        self.assertEqual(backEnd._cached_student_row.cache_info().currsize, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()